@@ -0,0 +1,238 @@
+import gc
+import unittest
+
+import numpy as np
+from PIL import Image
+
+import sys; sys.path.append('../')
+from trident.wsi_objects.CuCIMWSI import CuCIMWSI, _acquire_handle, _try_parse_float
+from trident.wsi_objects.WSI import WSI
+
+
+"""
+Unit tests for the CPU-side logic of the CuCIMWSI backend: metadata
+flattening, MPP extraction, pyramid level selection and the read_regions
+pipeline. These run without cucim/cupy or a GPU by standing in for the
+CuImage handle with host NumPy arrays.
+"""
+
+
+class _FakeCuImage:
+    """Host-only stand-in for cucim.CuImage single and batched region reads."""
+
+    def __init__(self, batched: bool = False):
+        self.batched = batched
+
+    def read_region(self, location, level=0, size=None, device='cpu',
+                    batch_size=None, num_workers=None):
+        if batch_size is not None:
+            if not self.batched:
+                raise TypeError("read_region() got an unexpected keyword argument 'batch_size'")
+
+            def batches():
+                for start in range(0, len(location), batch_size):
+                    chunk = location[start:start + batch_size]
+                    yield np.stack([self._tile(loc, size) for loc in chunk])
+
+            return batches()
+        return self._tile(location, size)
+
+    @staticmethod
+    def _tile(location, size):
+        # RGBA tile encoding its location in the first two channels so that
+        # output order can be asserted.
+        width, height = size
+        tile = np.zeros((height, width, 4), dtype=np.uint8)
+        tile[..., 0] = location[0] % 256
+        tile[..., 1] = location[1] % 256
+        tile[..., 3] = 255
+        return tile
+
+
+def _make_wsi(properties=None):
+    wsi = CuCIMWSI(slide_path='fake_slide.svs')
+    if properties is not None:
+        wsi.properties = properties
+    return wsi
+
+
+class TestTryParseFloat(unittest.TestCase):
+
+    def test_numbers_and_numeric_strings(self):
+        self.assertEqual(_try_parse_float(0.25), 0.25)
+        self.assertEqual(_try_parse_float(3), 3.0)
+        self.assertEqual(_try_parse_float('0.2525'), 0.2525)
+        self.assertEqual(_try_parse_float(' 0.25 '), 0.25)
+        self.assertEqual(_try_parse_float('-1.5'), -1.5)
+        self.assertEqual(_try_parse_float('2.5e-1'), 0.25)
+
+    def test_non_numeric_values(self):
+        self.assertIsNone(_try_parse_float(None))
+        self.assertIsNone(_try_parse_float(''))
+        self.assertIsNone(_try_parse_float('unknown'))
+        self.assertIsNone(_try_parse_float('40x'))
+        self.assertIsNone(_try_parse_float({'mpp': 0.25}))
+
+
+class TestMetadataFlattening(unittest.TestCase):
+
+    def test_nested_keys_are_lowercased_and_dotted(self):
+        flat = CuCIMWSI._build_flat_meta(
+            {'Aperio': {'MPP': '0.25', 'Nested': {'Deep': 1}}, 'top': 2}
+        )
+        self.assertEqual(flat['aperio.mpp'], '0.25')
+        self.assertEqual(flat['aperio.nested.deep'], 1)
+        self.assertEqual(flat['top'], 2)
+
+    def test_json_string_metadata(self):
+        flat = CuCIMWSI._build_flat_meta('{"aperio": {"MPP": "0.5"}}')
+        self.assertEqual(flat['aperio.mpp'], '0.5')
+
+
+class TestFetchMPP(unittest.TestCase):
+
+    def test_aperio_fast_path(self):
+        wsi = _make_wsi({'aperio': {'MPP': '0.2525'}})
+        self.assertAlmostEqual(wsi._fetch_mpp(), 0.2525)
+
+    def test_openslide_fast_path(self):
+        wsi = _make_wsi({'openslide': {'mpp-x': '0.5'}})
+        self.assertAlmostEqual(wsi._fetch_mpp(), 0.5)
+
+    def test_axis_keys_average(self):
+        wsi = _make_wsi({'tiff': {'resolution-x': '0.5', 'resolution-y': '0.7'}})
+        self.assertAlmostEqual(wsi._fetch_mpp(), 0.6)
+
+    def test_single_axis_mirrors_to_both(self):
+        wsi = _make_wsi({'tiff': {'resolution-y': '0.7'}})
+        self.assertAlmostEqual(wsi._fetch_mpp(), 0.7)
+
+    def test_hamamatsu_xresolution_is_not_mpp(self):
+        # NDPI XResolution is a resolution (pixels per unit), not microns
+        # per pixel, and must never be returned as MPP.
+        wsi = _make_wsi({'hamamatsu': {'XResolution': '22727'}})
+        with self.assertRaises(ValueError):
+            wsi._fetch_mpp()
+
+    def test_hamamatsu_mpp_key(self):
+        wsi = _make_wsi({'hamamatsu': {'mpp': '0.46'}})
+        self.assertAlmostEqual(wsi._fetch_mpp(), 0.46)
+
+    def test_custom_keys(self):
+        wsi = _make_wsi({'vendor': {'pixel-size': '0.33'}})
+        mpp = wsi._fetch_mpp({'mpp_x': 'vendor.pixel-size', 'mpp_y': 'vendor.pixel-size'})
+        self.assertAlmostEqual(mpp, 0.33)
+
+    def test_missing_mpp_raises(self):
+        wsi = _make_wsi({'foo': {'bar': 'baz'}})
+        with self.assertRaises(ValueError):
+            wsi._fetch_mpp()
+
+
+class TestLevelSelection(unittest.TestCase):
+
+    def test_override_matches_base_implementation(self):
+        wsi = _make_wsi()
+        wsi.level_downsamples = (1.0, 2.0, 4.0, 8.0, 16.0)
+        wsi._level_ds_arr = np.asarray(wsi.level_downsamples, dtype=np.float32)
+        for downsample in (0.5, 1.0, 1.005, 1.5, 2.0, 3.9, 4.0, 5.0, 16.0, 100.0):
+            expected_level, expected_custom = WSI.get_best_level_and_custom_downsample(wsi, downsample)
+            level, custom = wsi.get_best_level_and_custom_downsample(downsample)
+            self.assertEqual(level, expected_level, msg=f'downsample={downsample}')
+            self.assertAlmostEqual(custom, expected_custom, places=4, msg=f'downsample={downsample}')
+
+    def test_falls_back_to_base_before_lazy_init(self):
+        wsi = _make_wsi()
+        wsi.level_downsamples = (1.0, 4.0)
+        self.assertEqual(wsi.get_best_level_and_custom_downsample(4.0), (1, 1.0))
+
+
+class TestSharedHandleClose(unittest.TestCase):
+
+    class _Handle:
+        def __init__(self):
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    def _open_sharing(self, path, handle, count):
+        instances = []
+        for _ in range(count):
+            wsi = _make_wsi()
+            wsi.img = _acquire_handle(wsi, path, lambda p: handle)
+            instances.append(wsi)
+        return instances
+
+    def test_close_only_closes_after_last_user(self):
+        handle = self._Handle()
+        first, second = self._open_sharing('shared_a.svs', handle, 2)
+        self.assertIs(second.img, handle)  # cache hit, same underlying handle
+        first.close()
+        self.assertFalse(handle.closed)
+        second.close()
+        self.assertTrue(handle.closed)
+
+    def test_garbage_collected_instance_releases_its_share(self):
+        handle = self._Handle()
+        leaked, survivor = self._open_sharing('shared_b.svs', handle, 2)
+        del leaked
+        gc.collect()
+        self.assertFalse(handle.closed)
+        survivor.close()
+        self.assertTrue(handle.closed)
+
+    def test_close_is_idempotent(self):
+        handle = self._Handle()
+        wsi, = self._open_sharing('shared_c.svs', handle, 1)
+        wsi.close()
+        wsi.close()
+        self.assertTrue(handle.closed)
+
+
+class TestReadRegions(unittest.TestCase):
+    LOCATIONS = [(0, 0), (16, 0), (32, 16), (48, 32), (64, 64), (80, 128)]
+
+    def _check_order(self, regions):
+        self.assertEqual(len(regions), len(self.LOCATIONS))
+        for (x, y), region in zip(self.LOCATIONS, regions):
+            arr = np.asarray(region)
+            self.assertEqual(arr.shape, (4, 4, 3))  # alpha stripped
+            self.assertEqual(int(arr[0, 0, 0]), x % 256)
+            self.assertEqual(int(arr[0, 0, 1]), y % 256)
+
+    def test_threaded_fallback_preserves_order(self):
+        wsi = _make_wsi()
+        wsi.img = _FakeCuImage(batched=False)
+        regions = list(wsi.read_regions(self.LOCATIONS, level=0, size=(4, 4), read_as='numpy', num_workers=3))
+        self._check_order(regions)
+
+    def test_native_batched_path_preserves_order(self):
+        wsi = _make_wsi()
+        wsi.img = _FakeCuImage(batched=True)
+        regions = list(wsi.read_regions(self.LOCATIONS, level=0, size=(4, 4), read_as='numpy', num_workers=2))
+        self._check_order(regions)
+
+    def test_pil_output_is_rgb(self):
+        wsi = _make_wsi()
+        wsi.img = _FakeCuImage(batched=True)
+        regions = list(wsi.read_regions(self.LOCATIONS[:2], level=0, size=(4, 4)))
+        for region in regions:
+            self.assertIsInstance(region, Image.Image)
+            self.assertEqual(region.mode, 'RGB')
+
+    def test_invalid_read_as_raises(self):
+        wsi = _make_wsi()
+        wsi.img = _FakeCuImage()
+        with self.assertRaises(ValueError):
+            list(wsi.read_regions([(0, 0)], level=0, size=(4, 4), read_as='bogus'))
+
+    def test_read_region_keep_alpha(self):
+        wsi = _make_wsi()
+        wsi.img = _FakeCuImage()
+        region = wsi.read_region((8, 0), level=0, size=(4, 4), read_as='numpy', keep_alpha=True)
+        self.assertEqual(region.shape, (4, 4, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()